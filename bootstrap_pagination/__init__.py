@@ -0,0 +1,6 @@
+import django
+
+
+# Django 3.2+ discovers the AppConfig in apps.py by itself
+if (1, 7, 0) <= django.VERSION < (3, 2, 0):
+    default_app_config = 'bootstrap_pagination.apps.BootstrapPaginationConfig'
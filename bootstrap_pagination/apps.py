@@ -0,0 +1,20 @@
+import logging
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class BootstrapPaginationConfig(AppConfig):
+    name = 'bootstrap_pagination'
+    verbose_name = 'Bootstrap Pagination'
+
+    def ready(self):
+        # Optionally do the lazy first-request work up front, eg: so preforked
+        # workers share the warmed state
+        if getattr(settings, 'BOOTSTRAP_PAGINATION_WARM_UP', False):
+            from bootstrap_pagination.warmup import warm_up
+            for name, count, seconds in warm_up():
+                logger.info("Warmed up %s: %d in %.1fms", name, count, seconds * 1000)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from bootstrap_pagination.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = ("Load the bootstrap_pagination tag library, compile the pagination "
+            "templates and prime the translation and URL caches, reporting how "
+            "long each step took.")
+
+    def handle(self, *args, **options):
+        total = 0.0
+        for name, count, seconds in warm_up():
+            total += seconds
+            self.stdout.write("%s: %d warmed in %.1fms" % (name, count, seconds * 1000))
+        self.stdout.write("Total: %.1fms" % (total * 1000))
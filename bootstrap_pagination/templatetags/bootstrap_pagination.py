@@ -1,3 +1,4 @@
+import json
 import re
 
 import django
@@ -9,7 +10,7 @@ from django.template import Node, Library, TemplateSyntaxError, VariableDoesNotE
 from django.template.loader import get_template
 from django.conf import settings
 from django.http import QueryDict
-from django.utils.html import mark_safe
+from django.utils.html import escape, mark_safe
 from django.utils.translation import ugettext_lazy as _
 
 
@@ -26,6 +27,23 @@ else:
 
 register = Library()
 
+# Matches the name=value keyword arguments accepted by both tags
+kwarg_re = re.compile(r'(\w+)=(.+)')
+
+# Markup emitted in place of the bar for each include_mode
+INCLUDE_TEMPLATES = {
+    "esi": '<esi:include src="%s" />',
+    "ssi": '<!--#include virtual="%s" -->',
+}
+# Variables the ESI / SSI processor replaces with the query string of the page
+INCLUDE_QUERY_STRINGS = {
+    "esi": "$(QUERY_STRING)",
+    "ssi": "${QUERY_STRING}",
+}
+INCLUDE_SALT = "bootstrap_pagination.include"
+# Name of the query parameter holding the signed state of an include
+INCLUDE_PARAM_NAME = "_bp_state"
+
 
 # Starting from django 1.10 Context object no longer has attribute current_app
 # Instead application code could set current_app to HttpRequest object, if so we seek it there
@@ -59,7 +77,9 @@ def get_page_url(page_num, current_app, url_view_name, url_extra_args, url_extra
     Helper function to return a valid URL string given the template tag parameters
     """
     if url_view_name is not None:
-        # Add page param to the kwargs list. Overrides any previously set parameter of the same name.
+        # Add page param to a copy of the kwargs list. Overrides any previously set parameter of the same name.
+        # The caller's dict must not be modified, it may be shared by concurrent renders of the same node.
+        url_extra_kwargs = dict(url_extra_kwargs)
         url_extra_kwargs[url_param_name] = page_num
 
         try:
@@ -99,6 +119,133 @@ def get_page_url(page_num, current_app, url_view_name, url_extra_args, url_extra
     return url
 
 
+def dump_include_state(state):
+    """
+    Serialize and sign the state of an include. The same state always gives the
+    same value, so that the include URL can be used as a cache key.
+    """
+    from django.core import signing  # Django 1.4+, only needed by include_mode
+
+    data = json.dumps(state, sort_keys=True, separators=(',', ':'))
+    return signing.Signer(salt=INCLUDE_SALT).sign(signing.b64_encode(data.encode('utf-8')).decode('ascii'))
+
+
+def load_include_state(value):
+    """
+    Verify and deserialize the state of an include, raising BadSignature if it
+    has been tampered with.
+    """
+    from django.core import signing
+
+    data = signing.Signer(salt=INCLUDE_SALT).unsign(value)
+    return json.loads(signing.b64_decode(data.encode('ascii')).decode('utf-8'))
+
+
+def get_include_kwarg(name, value):
+    """
+    Convert a resolved tag parameter to a JSON serializable value. The URL
+    arguments are converted to text, as reverse() would do with them anyway.
+    """
+    try:
+        from django.utils.encoding import force_text
+    except ImportError:  # Django 4 removed the alias
+        from django.utils.encoding import force_str as force_text
+
+    if name == "url_extra_args" and value is not None:
+        return [force_text(arg) for arg in value]
+    elif name == "url_extra_kwargs" and value is not None:
+        return dict((force_text(key), force_text(arg)) for key, arg in value.items())
+    elif name == "url_get_params" and value is not None:
+        if not isinstance(value, QueryDict):
+            tmp = QueryDict(mutable=True)
+            tmp.update(value)
+            value = tmp
+        return value.urlencode()
+    elif value is None or isinstance(value, (bool, int)):
+        return value
+    return force_text(value)
+
+
+def render_include(include_mode, tag, page, kwargs, current_app):
+    """
+    Render an ESI or SSI include of the pagination_bar view in place of the bar
+    itself, so that the bar can be cached separately from the surrounding page.
+
+    Everything the view needs to render the bar is passed in a signed "state"
+    parameter, as labels are output unescaped. Unless url_get_params is given,
+    the query string of the page is left for the ESI / SSI processor to append,
+    so that it isn't embedded in the page.
+    """
+    from django.utils.http import urlencode
+
+    include_mode = str(include_mode).lower()
+    if include_mode not in INCLUDE_TEMPLATES:
+        raise Exception("Optional argument \"include_mode\" expecting one of \"esi\", or \"ssi\"")
+
+    state = {
+        "tag": tag,
+        "page": page.number,
+        "count": page.paginator.count,
+        "per_page": page.paginator.per_page,
+        "orphans": page.paginator.orphans,
+        "current_app": current_app,
+        "kwargs": dict((name, get_include_kwarg(name, value)) for name, value in kwargs.items()),
+    }
+
+    url = reverse("bootstrap_pagination:bar", current_app=current_app)
+    url += '?' + urlencode({INCLUDE_PARAM_NAME: dump_include_state(state)})
+    if "url_get_params" not in kwargs:
+        url += '&' + INCLUDE_QUERY_STRINGS[include_mode]
+
+    # Only ESI uses an HTML attribute, SSI processors take the URL literally
+    if include_mode == "esi":
+        url = escape(url)
+
+    return mark_safe(INCLUDE_TEMPLATES[include_mode] % url)
+
+
+def render_pager(page, kwargs, current_app, request_get_params):
+    """
+    Render the Bootstrap pager for a Page object given the resolved tag parameters
+    """
+    previous_label = mark_safe(kwargs.get("previous_label", _("Previous Page")))
+    next_label = mark_safe(kwargs.get("next_label", _("Next Page")))
+    previous_title = mark_safe(kwargs.get("previous_title", _("Previous Page")))
+    next_title = mark_safe(kwargs.get("next_title", _("Next Page")))
+
+    url_view_name = kwargs.get("url_view_name", None)
+    if url_view_name is not None:
+        url_view_name = str(url_view_name)
+
+    url_param_name = str(kwargs.get("url_param_name", "page"))
+    url_extra_args = kwargs.get("url_extra_args", [])
+    url_extra_kwargs = kwargs.get("url_extra_kwargs", {})
+    url_get_params = kwargs.get("url_get_params", request_get_params)
+    url_anchor = kwargs.get("url_anchor", None)
+
+    extra_pager_classes = kwargs.get("extra_pager_classes", "")
+
+    previous_page_url = None
+    if page.has_previous():
+        previous_page_url = get_page_url(page.previous_page_number(), current_app, url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
+
+    next_page_url = None
+    if page.has_next():
+        next_page_url = get_page_url(page.next_page_number(), current_app, url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
+
+    return get_template("bootstrap_pagination/pager.html").render(
+        Context({
+            'page': page,
+            'previous_label': previous_label,
+            'next_label': next_label,
+            'previous_title': previous_title,
+            'next_title': next_title,
+            'previous_page_url': previous_page_url,
+            'next_page_url': next_page_url,
+            'extra_pager_classes': extra_pager_classes,
+        }))
+
+
 class BootstrapPagerNode(Node):
     def __init__(self, page, kwargs):
         self.page = page
@@ -117,42 +264,130 @@ class BootstrapPagerNode(Node):
             except VariableDoesNotExist:
                 kwargs[argname] = None
 
-        previous_label = mark_safe(kwargs.get("previous_label", _("Previous Page")))
-        next_label = mark_safe(kwargs.get("next_label", _("Next Page")))
-        previous_title = mark_safe(kwargs.get("previous_title", _("Previous Page")))
-        next_title = mark_safe(kwargs.get("next_title", _("Next Page")))
+        include_mode = kwargs.pop("include_mode", None)
+        if include_mode is not None:
+            return render_include(include_mode, "pager", page, kwargs, get_current_app(context))
 
-        url_view_name = kwargs.get("url_view_name", None)
-        if url_view_name is not None:
-            url_view_name = str(url_view_name)
+        return render_pager(page, kwargs, get_current_app(context), context['request'].GET)
 
-        url_param_name = str(kwargs.get("url_param_name", "page"))
-        url_extra_args = kwargs.get("url_extra_args", [])
-        url_extra_kwargs = kwargs.get("url_extra_kwargs", {})
-        url_get_params = kwargs.get("url_get_params", context['request'].GET)
-        url_anchor = kwargs.get("url_anchor", None)
 
-        extra_pager_classes = kwargs.get("extra_pager_classes", "")
+def render_pagination(page, kwargs, current_app, request_get_params):
+    """
+    Render the Bootstrap pagination bar for a Page object given the resolved tag parameters
+    """
+    # Unpack our keyword arguments, substituting defaults where necessary
+    range_length = kwargs.get("range", None)
+    if range_length is not None:
+        range_length = int(range_length)
+
+    size = kwargs.get("size", None)
+    if size is not None:
+        size = str(size.lower())
+        if size not in ["small", "large"]:
+            raise Exception("Optional argument \"size\" expecting one of \"small\", or \"large\"")
+
+    show_prev_next = strToBool(kwargs.get("show_prev_next", "true"))
+    previous_label = mark_safe(kwargs.get("previous_label", "&larr;"))
+    next_label = mark_safe(kwargs.get("next_label", "&rarr;"))
+    show_first_last = strToBool(kwargs.get("show_first_last", "false"))
+    first_label = mark_safe(kwargs.get("first_label", "&laquo;"))
+    last_label = mark_safe(kwargs.get("last_label", "&raquo;"))
+    show_index_range = strToBool(kwargs.get("show_index_range", "false"))
+
+    url_view_name = kwargs.get("url_view_name", None)
+    if url_view_name is not None:
+        url_view_name = str(url_view_name)
 
-        previous_page_url = None
-        if page.has_previous():
-            previous_page_url = get_page_url(page.previous_page_number(), get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
+    url_param_name = str(kwargs.get("url_param_name", "page"))
+    url_extra_args = kwargs.get("url_extra_args", [])
+    url_extra_kwargs = kwargs.get("url_extra_kwargs", {})
+    url_get_params = kwargs.get("url_get_params", request_get_params)
+    url_anchor = kwargs.get("url_anchor", None)
 
-        next_page_url = None
-        if page.has_next():
-            next_page_url = get_page_url(page.next_page_number(), get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
+    extra_pagination_classes = kwargs.get("extra_pagination_classes", "")
 
-        return get_template("bootstrap_pagination/pager.html").render(
-            Context({
-                'page': page,
-                'previous_label': previous_label,
-                'next_label': next_label,
-                'previous_title': previous_title,
-                'next_title': next_title,
-                'previous_page_url': previous_page_url,
-                'next_page_url': next_page_url,
-                'extra_pager_classes': extra_pager_classes,
-            }))
+    # Generage our viewable page range
+    page_count = page.paginator.num_pages
+    current_page = page.number
+
+    if range_length is None:
+        range_min = 1
+        range_max = page_count
+    else:
+        if range_length < 1:
+            raise Exception("Optional argument \"range\" expecting integer greater than 0")
+        elif range_length > page_count:
+            range_length = page_count
+
+        range_length -= 1
+        range_min = max(current_page - (range_length // 2), 1)
+        range_max = min(current_page + (range_length // 2), page_count)
+        range_diff = range_max - range_min
+        if range_diff < range_length:
+            shift = range_length - range_diff
+            if range_min - shift > 0:
+                range_min -= shift
+            else:
+                range_max += shift
+
+    page_range = range(range_min, range_max + 1)
+
+    # Generate our URLs (page range + special urls for first, previous, next, and last).
+    # URLs are remembered for the duration of this render only, so that first/last/previous/next
+    # links falling inside the page range don't need another reverse() call.
+    urls = {}
+
+    def url_for(page_num):
+        if page_num not in urls:
+            urls[page_num] = get_page_url(page_num, current_app, url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
+        return urls[page_num]
+
+    page_urls = []
+    for curpage in page_range:
+        if not show_index_range:
+            index_range = ""
+        elif curpage == page.paginator.num_pages:
+            index_range = "%s-%s" % (1 + (curpage - 1) * page.paginator.per_page, len(page.paginator.object_list), )
+        else:
+            index_range = "%s-%s" % (1 + (curpage - 1) * page.paginator.per_page, curpage * page.paginator.per_page, )
+
+        url = url_for(curpage)
+        page_urls.append((curpage, index_range, url))
+
+    first_page_url = None
+    if current_page >= 1:
+        first_page_url = url_for(1)
+
+    last_page_url = None
+    if current_page <= page_count:
+        last_page_url = url_for(page_count)
+
+    previous_page_url = None
+    if page.has_previous():
+        previous_page_url = url_for(page.previous_page_number())
+
+    next_page_url = None
+    if page.has_next():
+        next_page_url = url_for(page.next_page_number())
+
+    return get_template("bootstrap_pagination/pagination.html").render(
+        Context({
+            'page': page,
+            'size': size,
+            'show_index_range': show_index_range,
+            'show_prev_next': show_prev_next,
+            'show_first_last': show_first_last,
+            'previous_label': previous_label,
+            'next_label': next_label,
+            'first_label': first_label,
+            'last_label': last_label,
+            'page_urls': page_urls,
+            'first_page_url': first_page_url,
+            'last_page_url': last_page_url,
+            'previous_page_url': previous_page_url,
+            'next_page_url': next_page_url,
+            'extra_pagination_classes': extra_pagination_classes,
+        }))
 
 
 class BootstrapPaginationNode(Node):
@@ -176,110 +411,11 @@ class BootstrapPaginationNode(Node):
             except VariableDoesNotExist:
                 kwargs[argname] = None
 
-        # Unpack our keyword arguments, substituting defaults where necessary
-        range_length = kwargs.get("range", None)
-        if range_length is not None:
-            range_length = int(range_length)
-
-        size = kwargs.get("size", None)
-        if size is not None:
-            size = str(size.lower())
-            if size not in ["small", "large"]:
-                raise Exception("Optional argument \"size\" expecting one of \"small\", or \"large\"")
-
-        show_prev_next = strToBool(kwargs.get("show_prev_next", "true"))
-        previous_label = mark_safe(kwargs.get("previous_label", "&larr;"))
-        next_label = mark_safe(kwargs.get("next_label", "&rarr;"))
-        show_first_last = strToBool(kwargs.get("show_first_last", "false"))
-        first_label = mark_safe(kwargs.get("first_label", "&laquo;"))
-        last_label = mark_safe(kwargs.get("last_label", "&raquo;"))
-        show_index_range = strToBool(kwargs.get("show_index_range", "false"))
-
-        url_view_name = kwargs.get("url_view_name", None)
-        if url_view_name is not None:
-            url_view_name = str(url_view_name)
-
-        url_param_name = str(kwargs.get("url_param_name", "page"))
-        url_extra_args = kwargs.get("url_extra_args", [])
-        url_extra_kwargs = kwargs.get("url_extra_kwargs", {})
-        url_get_params = kwargs.get("url_get_params", context['request'].GET)
-        url_anchor = kwargs.get("url_anchor", None)
-
-        extra_pagination_classes = kwargs.get("extra_pagination_classes", "")
-
-        # Generage our viewable page range
-        page_count = page.paginator.num_pages
-        current_page = page.number
-
-        if range_length is None:
-            range_min = 1
-            range_max = page_count
-        else:
-            if range_length < 1:
-                raise Exception("Optional argument \"range\" expecting integer greater than 0")
-            elif range_length > page_count:
-                range_length = page_count
-
-            range_length -= 1
-            range_min = max(current_page - (range_length // 2), 1)
-            range_max = min(current_page + (range_length // 2), page_count)
-            range_diff = range_max - range_min
-            if range_diff < range_length:
-                shift = range_length - range_diff
-                if range_min - shift > 0:
-                    range_min -= shift
-                else:
-                    range_max += shift
+        include_mode = kwargs.pop("include_mode", None)
+        if include_mode is not None:
+            return render_include(include_mode, "paginate", page, kwargs, get_current_app(context))
 
-        page_range = range(range_min, range_max + 1)
-
-        # Generate our URLs (page range + special urls for first, previous, next, and last)
-        page_urls = []
-        for curpage in page_range:
-            if not show_index_range:
-                index_range = ""
-            elif curpage == page.paginator.num_pages:
-                index_range = "%s-%s" % (1 + (curpage - 1) * page.paginator.per_page, len(page.paginator.object_list), )
-            else:
-                index_range = "%s-%s" % (1 + (curpage - 1) * page.paginator.per_page, curpage * page.paginator.per_page, )
-
-            url = get_page_url(curpage, get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
-            page_urls.append((curpage, index_range, url))
-
-        first_page_url = None
-        if current_page >= 1:
-            first_page_url = get_page_url(1, get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
-
-        last_page_url = None
-        if current_page <= page_count:
-            last_page_url = get_page_url(page_count, get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
-
-        previous_page_url = None
-        if page.has_previous():
-            previous_page_url = get_page_url(page.previous_page_number(), get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
-
-        next_page_url = None
-        if page.has_next():
-            next_page_url = get_page_url(page.next_page_number(), get_current_app(context), url_view_name, url_extra_args, url_extra_kwargs, url_param_name, url_get_params, url_anchor)
-
-        return get_template("bootstrap_pagination/pagination.html").render(
-            Context({
-                'page': page,
-                'size': size,
-                'show_index_range': show_index_range,
-                'show_prev_next': show_prev_next,
-                'show_first_last': show_first_last,
-                'previous_label': previous_label,
-                'next_label': next_label,
-                'first_label': first_label,
-                'last_label': last_label,
-                'page_urls': page_urls,
-                'first_page_url': first_page_url,
-                'last_page_url': last_page_url,
-                'previous_page_url': previous_page_url,
-                'next_page_url': next_page_url,
-                'extra_pagination_classes': extra_pagination_classes,
-            }))
+        return render_pagination(page, kwargs, get_current_app(context), context['request'].GET)
 
 
 @register.tag
@@ -355,6 +491,11 @@ def bootstrap_paginate(parser, token):
                                    utilized in Bootstrap 4 installatinos  to
                                    add the appropriate alignment classes from
                                    Flexbox utilites, eg:  justify-content-center
+
+        include_mode - Accepts "esi" or "ssi". If set, an Edge Side Include or
+                       Server Side Include of the bar, rendered by the
+                       bootstrap_pagination.urls view, is output instead of
+                       the bar itself. Defaults to None.
     """
     bits = token.split_contents()
     if len(bits) < 2:
@@ -364,8 +505,6 @@ def bootstrap_paginate(parser, token):
     kwargs = {}
     bits = bits[2:]
 
-    kwarg_re = re.compile(r'(\w+)=(.+)')
-
     if len(bits):
         for bit in bits:
             match = kwarg_re.match(bit)
@@ -429,6 +568,11 @@ def bootstrap_pager(parser, token):
                               HTML element. This could be  used to,
                               as an example, add a class to prevent
                               the pager from showing up when printing.
+
+        include_mode - Accepts "esi" or "ssi". If set, an Edge Side Include or
+                       Server Side Include of the pager, rendered by the
+                       bootstrap_pagination.urls view, is output instead of
+                       the pager itself. Defaults to None.
     """
     bits = token.split_contents()
     if len(bits) < 2:
@@ -438,8 +582,6 @@ def bootstrap_pager(parser, token):
     kwargs = {}
     bits = bits[2:]
 
-    kwarg_re = re.compile(r'(\w+)=(.+)')
-
     if len(bits):
         for bit in bits:
             match = kwarg_re.match(bit)
@@ -0,0 +1,13 @@
+try:
+    from django.urls import re_path
+except ImportError:  # Django < 2
+    from django.conf.urls import url as re_path
+
+from bootstrap_pagination import views
+
+
+app_name = 'bootstrap_pagination'
+
+urlpatterns = [
+    re_path(r'^bar/$', views.pagination_bar, name='bar'),
+]
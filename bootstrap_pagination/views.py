@@ -0,0 +1,196 @@
+import hashlib
+from calendar import timegm
+
+from django.conf import settings
+from django.core import signing
+from django.core.paginator import Paginator
+from django.db.models import Max
+from django.db.models.query import QuerySet
+from django.http import HttpResponse, HttpResponseBadRequest, QueryDict
+from django.utils.cache import patch_cache_control
+from django.utils.encoding import force_bytes
+from django.utils import translation
+from django.utils.http import http_date
+
+from bootstrap_pagination.templatetags.bootstrap_pagination import INCLUDE_PARAM_NAME, load_include_state, render_pager, render_pagination
+
+
+class ConditionalPaginationMixin(object):
+    """
+    Adds conditional GET (ETag / Last-Modified) support to a ListView.
+
+    The validators are computed from the paginator state only: the page number,
+    the total count, per_page, an optional max() aggregate over
+    ``last_modified_field``, the parameters the pagination tags use to build
+    their URLs and the active language. A matching If-None-Match or
+    If-Modified-Since header is answered with 304 Not Modified before the page
+    slice is fetched or anything is rendered. Requires Django 1.11+.
+
+    Example::
+
+        class PostList(ConditionalPaginationMixin, ListView):
+            model = Post
+            paginate_by = 20
+            last_modified_field = 'updated_at'
+            pagination_options = {'range': 10}
+
+
+    Attributes::
+
+        last_modified_field - The name of a date/time field aggregated with
+                              max() for the Last-Modified header. Defaults to
+                              None, which only sends an ETag.
+
+        pagination_options - A dictionary of the options given to the
+                             bootstrap_paginate / bootstrap_pager tag in the
+                             template. Included in the ETag so that a change
+                             of options invalidates cached pages. Defaults to
+                             None. Override get_pagination_options() to
+                             compute them per request.
+
+        pagination_url_param_name - The url_param_name given to the tags, if
+                                    any. Defaults to the view's page_kwarg.
+    """
+    last_modified_field = None
+    pagination_options = None
+    pagination_url_param_name = None
+
+    _pagination_state = None
+
+    def paginate_queryset(self, queryset, page_size):
+        # Reuse the paginator built while checking the validators so the count isn't run twice
+        if self._pagination_state is not None:
+            return self._pagination_state
+        return super(ConditionalPaginationMixin, self).paginate_queryset(queryset, page_size)
+
+    def get_pagination_state(self):
+        """
+        Return the (paginator, page, object_list, is_paginated) tuple for this request.
+        """
+        if self._pagination_state is None:
+            queryset = self.get_queryset()
+            page_size = self.get_paginate_by(queryset)
+            if page_size:
+                self._pagination_state = self.paginate_queryset(queryset, page_size)
+            else:
+                self._pagination_state = (None, None, queryset, False)
+        return self._pagination_state
+
+    def get_pagination_options(self):
+        """
+        Return the options given to the pagination tag in the template.
+        """
+        if self.pagination_options is None:
+            return {}
+        return self.pagination_options
+
+    def get_pagination_url_params(self):
+        """
+        Return the query parameters the pagination tags build their URLs from,
+        excluding the page number itself.
+        """
+        url_param_name = self.pagination_url_param_name or self.page_kwarg
+        return sorted((key, value)
+                      for key, values in self.request.GET.lists()
+                      if key != url_param_name
+                      for value in values)
+
+    def get_last_modified(self):
+        """
+        Return the most recent value of last_modified_field, or None.
+        """
+        if self.last_modified_field is None:
+            return None
+        paginator, page, queryset, is_paginated = self.get_pagination_state()
+        if paginator is not None:
+            # Aggregate over every result, not just the current page
+            queryset = paginator.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+        return queryset.aggregate(last_modified=Max(self.last_modified_field))['last_modified']
+
+    def get_etag(self, last_modified):
+        """
+        Return a weak ETag for the current page of results. It is weak as it
+        doesn't cover the objects themselves, only the paginator state.
+        """
+        paginator, page, queryset, is_paginated = self.get_pagination_state()
+        if paginator is None:
+            count = queryset.count() if isinstance(queryset, QuerySet) else len(queryset)
+            state = (None, count, None)
+        else:
+            state = (page.number, paginator.count, paginator.per_page)
+        validator = repr((
+            state,
+            last_modified,
+            # The labels and titles of the bar are translated
+            translation.get_language(),
+            sorted(self.kwargs.items()),
+            sorted(self.get_pagination_options().items()),
+            self.get_pagination_url_params(),
+        ))
+        return 'W/"%s"' % hashlib.md5(force_bytes(validator)).hexdigest()
+
+    def get(self, request, *args, **kwargs):
+        # Imported here so the module can be imported on Django < 1.11
+        from django.utils.cache import get_conditional_response
+
+        last_modified = self.get_last_modified()
+        etag = self.get_etag(last_modified)
+        if last_modified is not None:
+            last_modified = timegm(last_modified.utctimetuple())
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super(ConditionalPaginationMixin, self).get(request, *args, **kwargs)
+
+        if last_modified and not response.has_header('Last-Modified'):
+            response['Last-Modified'] = http_date(last_modified)
+        if not response.has_header('ETag'):
+            response['ETag'] = etag
+        return response
+
+
+def pagination_bar(request):
+    """
+    Render only the pagination bar or pager described by the signed state of an
+    include emitted by the tags' include_mode, through the same code as the tags.
+
+    The response is cached for BOOTSTRAP_PAGINATION_INCLUDE_CACHE_TIMEOUT
+    seconds, if set.
+    """
+    # The processor appends the page's query string after our own parameter,
+    # so ours is the first value should the page use the same name
+    values = request.GET.getlist(INCLUDE_PARAM_NAME)
+    try:
+        state = load_include_state(values[0] if values else "")
+    except signing.BadSignature:
+        return HttpResponseBadRequest()
+
+    paginator = Paginator(range(state["count"]), state["per_page"], orphans=state["orphans"])
+    page = paginator.page(state["page"])
+
+    kwargs = state["kwargs"]
+    if kwargs.get("url_get_params") is not None:
+        kwargs["url_get_params"] = QueryDict(kwargs["url_get_params"])
+
+    # Without url_get_params the bar uses the query string of the page, which
+    # the ESI / SSI processor appended to ours
+    # Drop only our own parameter, keeping the page's in their original order
+    pairs = request.META.get("QUERY_STRING", "").split("&")
+    for index, pair in enumerate(pairs):
+        if pair.split("=", 1)[0] == INCLUDE_PARAM_NAME:
+            del pairs[index]
+            break
+    request_get_params = QueryDict("&".join(pairs))
+
+    if state["tag"] == "pager":
+        render = render_pager
+    else:
+        render = render_pagination
+    response = HttpResponse(render(page, kwargs, state["current_app"], request_get_params))
+
+    cache_timeout = getattr(settings, "BOOTSTRAP_PAGINATION_INCLUDE_CACHE_TIMEOUT", None)
+    if cache_timeout is not None:
+        patch_cache_control(response, public=True, max_age=cache_timeout)
+    return response
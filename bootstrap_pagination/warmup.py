@@ -0,0 +1,188 @@
+"""
+Helpers to perform the work the pagination tags would otherwise do lazily on
+the first request served by each process: loading the tag library, compiling
+the package templates (and any project templates using the tags), loading the
+translation catalogs and populating the URL resolver.
+
+Running this in a preforking server's master process (eg: gunicorn --preload)
+lets every worker share the warmed state through copy-on-write.
+
+Requires Django 1.8+ (multiple template engine support).
+"""
+import io
+import logging
+import os
+import re
+import time
+
+from django.conf import settings
+from django.template import engines, TemplateDoesNotExist, TemplateSyntaxError
+from django.template.backends.django import DjangoTemplates
+from django.utils import translation
+try:
+    from django.core.urlresolvers import get_resolver
+except ImportError:  # Django 2+
+    from django.urls import get_resolver
+from django.template.utils import get_app_template_dirs
+
+
+logger = logging.getLogger(__name__)
+
+
+PACKAGE_TEMPLATES = (
+    "bootstrap_pagination/pagination.html",
+    "bootstrap_pagination/pager.html",
+)
+
+# Every msgid used by the tags and the package templates
+TRANSLATED_STRINGS = (
+    "First Page",
+    "Previous Page",
+    "Current Page",
+    "Page",
+    "of",
+    "Next Page",
+    "Last Page",
+)
+
+# Matches a {% load %} tag pulling in the bootstrap_pagination library
+load_re = re.compile(r'{%\s*load\s[^%]*\bbootstrap_pagination\b[^%]*%}')
+
+
+def get_django_engines():
+    """
+    Return the configured template engines that use the Django template language.
+    """
+    return [engine for engine in engines.all() if isinstance(engine, DjangoTemplates)]
+
+
+def load_library():
+    """
+    Import and register the bootstrap_pagination tag library with every engine.
+    """
+    count = 0
+    for engine in get_django_engines():
+        engine.from_string("{% load bootstrap_pagination %}")
+        count += 1
+    return count
+
+
+def compile_package_templates():
+    """
+    Load the templates rendered by the tags, filling the cached template loader.
+    """
+    count = 0
+    for engine in get_django_engines():
+        for template_name in PACKAGE_TEMPLATES:
+            engine.get_template(template_name)
+            count += 1
+    return count
+
+
+def find_project_templates(engine):
+    """
+    Yield the names of all templates visible to the given engine which load
+    the bootstrap_pagination library.
+    """
+    dirs = list(engine.engine.dirs)
+    if engine.engine.app_dirs:
+        dirs.extend(get_app_template_dirs('templates'))
+
+    for template_dir in dirs:
+        for root, _dirnames, filenames in os.walk(template_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    with io.open(path, encoding=engine.engine.file_charset) as template_file:
+                        source = template_file.read()
+                except (IOError, UnicodeDecodeError):
+                    continue
+                if load_re.search(source):
+                    yield os.path.relpath(path, template_dir).replace(os.sep, '/')
+
+
+def compile_project_templates():
+    """
+    Load every project template that uses the pagination tags. Templates which
+    fail to compile are logged and skipped, so that a broken template can't
+    prevent startup.
+    """
+    count = 0
+    for engine in get_django_engines():
+        for template_name in find_project_templates(engine):
+            if template_name in PACKAGE_TEMPLATES:
+                continue
+            try:
+                engine.get_template(template_name)
+            except (TemplateDoesNotExist, TemplateSyntaxError):
+                logger.warning("Could not compile template %s", template_name, exc_info=True)
+                continue
+            count += 1
+    return count
+
+
+def get_warm_up_languages():
+    """
+    Return the languages in use: LANGUAGE_CODE plus those of an explicit
+    LANGUAGES setting. Django's default LANGUAGES lists almost a hundred
+    languages, most of which a project never serves.
+    """
+    if not settings.USE_I18N:
+        return []
+
+    languages = [settings.LANGUAGE_CODE]
+    if settings.is_overridden('LANGUAGES'):
+        for language, _name in settings.LANGUAGES:
+            if language not in languages:
+                languages.append(language)
+    return languages
+
+
+def prime_translations():
+    """
+    Load the translation catalog of every language in use and resolve the
+    strings used by the tags.
+    """
+    count = 0
+    for language in get_warm_up_languages():
+        with translation.override(language):
+            for message in TRANSLATED_STRINGS:
+                translation.gettext(message)
+        count += 1
+    return count
+
+
+def prime_url_resolver():
+    """
+    Import the root URLconf and populate the reverse() lookup tables used
+    when url_view_name is given. The tables are kept per language, so they
+    are filled for every language in use.
+    """
+    resolver = get_resolver()
+    for language in get_warm_up_languages() or [None]:
+        with translation.override(language):
+            resolver.reverse_dict
+            resolver.namespace_dict
+    return len(resolver.url_patterns)
+
+
+WARM_UP_STEPS = (
+    ("template library", load_library),
+    ("package templates", compile_package_templates),
+    ("project templates", compile_project_templates),
+    ("translations", prime_translations),
+    ("url resolver", prime_url_resolver),
+)
+
+
+def warm_up():
+    """
+    Run every warm up step, returning a list of (step name, item count, seconds)
+    tuples in the order the steps were run.
+    """
+    timings = []
+    for name, step in WARM_UP_STEPS:
+        start = time.time()
+        count = step()
+        timings.append((name, count, time.time() - start))
+    return timings
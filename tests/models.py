@@ -0,0 +1,6 @@
+from django.db import models
+
+
+class Post(models.Model):
+    id = models.AutoField(primary_key=True)
+    updated_at = models.DateTimeField()
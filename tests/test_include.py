@@ -0,0 +1,170 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import re
+import uuid
+
+import mock
+
+try:
+    from django.template.loader import get_template_from_string
+except ImportError:
+    from django.template import Engine
+    get_template_from_string = Engine.get_default().from_string
+
+from django.template import Context
+from django.test import Client
+from django.test.utils import override_settings
+import django.http
+from django.core.paginator import Paginator
+
+from bootstrap_pagination.templatetags.bootstrap_pagination import INCLUDE_PARAM_NAME, load_include_state
+
+
+esi_re = re.compile(r'<esi:include src="([^"]*)" />')
+ssi_re = re.compile(r'<!--#include virtual="([^"]*)" -->')
+
+
+def include_url(include_re, value):
+    # ESI includes are HTML attributes, SSI directives are taken literally
+    if include_re is esi_re:
+        return value.replace('&amp;', '&')
+    return value
+
+
+def process_includes(client, include_re, html, query_string):
+    """
+    Stand-in for an ESI/SSI processor: replace each include with the response
+    to a request for its URL, substituting the query string of the page.
+    """
+    def fetch(match):
+        url = include_url(include_re, match.group(1))
+        url = url.replace('$(QUERY_STRING)', query_string).replace('${QUERY_STRING}', query_string)
+        response = client.get(url)
+        assert response.status_code == 200, response.status_code
+        return response.content.decode('utf-8')
+    return include_re.sub(fetch, html)
+
+
+def include_state(include_re, html):
+    url = include_url(include_re, include_re.match(html).group(1))
+    value = django.http.QueryDict(url.split('?', 1)[1]).getlist(INCLUDE_PARAM_NAME)[0]
+    return load_include_state(value)
+
+
+@unittest.skipIf(django.VERSION < (1, 9, 0), "Requires Django 1.9+")
+class IncludeModeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client()
+        objects = ["obj%02x" % idx for idx in range(95)]
+        self.page = Paginator(objects, 10).page(4)
+        self.request = django.http.HttpRequest()
+        self.query_string = "filter=a&filter=b&page=4"
+        self.request.GET = django.http.QueryDict(self.query_string)
+
+    def render(self, source):
+        template = get_template_from_string("{% load bootstrap_pagination %}" + source)
+        return template.render(Context({'page_obj': self.page,
+                                        'request': self.request}))
+
+    def test_paginate_esi(self):
+        options = 'range=5 show_first_last="true" previous_label="<b>prev</b>" url_anchor="results"'
+        included = self.render('{%% bootstrap_paginate page_obj include_mode="esi" %s %%}' % options)
+        self.assertTrue(esi_re.match(included))
+        self.assertTrue(included.endswith('&amp;$(QUERY_STRING)" />'))
+
+        # The page's query string is left to the ESI processor
+        state = include_state(esi_re, included)
+        self.assertNotIn("url_get_params", state["kwargs"])
+        self.assertNotIn("filter", repr(state))
+        self.assertEqual(state["page"], 4)
+        self.assertEqual(state["count"], 95)
+        self.assertEqual(state["per_page"], 10)
+
+        expected = self.render('{%% bootstrap_paginate page_obj %s %%}' % options)
+        self.assertEqual(process_includes(self.client, esi_re, included, self.query_string), expected)
+        self.assertIn("filter=a&amp;filter=b", expected)
+        self.assertIn("<b>prev</b>", expected)
+
+    def test_paginate_view_name(self):
+        options = ('url_view_name="listing" url_extra_kwargs=extra url_get_params=params')
+        template = get_template_from_string(
+            "{% load bootstrap_pagination %}"
+            "{% bootstrap_paginate page_obj " + options + " %}|"
+            "{% bootstrap_paginate page_obj include_mode=\"esi\" " + options + " %}")
+        expected, included = template.render(Context({
+            'page_obj': self.page,
+            'extra': {'category': 'books'},
+            'params': {'sort': 'name'},
+            'request': self.request})).split('|')
+        self.assertEqual(process_includes(self.client, esi_re, included, self.query_string), expected)
+        self.assertIn("/listing/books/5/?sort=name", expected)
+
+        # Explicit url_get_params are signed in place of the page's query string
+        self.assertNotIn("QUERY_STRING", included)
+        self.assertEqual(include_state(esi_re, included)["kwargs"]["url_get_params"], "sort=name")
+
+    def test_paginate_url_kwargs_to_text(self):
+        category = uuid.uuid4()
+        template = get_template_from_string(
+            "{% load bootstrap_pagination %}"
+            "{% bootstrap_paginate page_obj url_view_name=\"listing\" url_extra_kwargs=extra %}|"
+            "{% bootstrap_paginate page_obj url_view_name=\"listing\" url_extra_kwargs=extra include_mode=\"esi\" %}")
+        expected, included = template.render(Context({
+            'page_obj': self.page,
+            'extra': {'category': category},
+            'request': self.request})).split('|')
+        self.assertEqual(process_includes(self.client, esi_re, included, self.query_string), expected)
+        self.assertIn("/listing/%s/5/" % category, expected)
+
+    def test_include_url_is_stable(self):
+        source = '{% bootstrap_paginate page_obj include_mode="esi" %}'
+        with mock.patch('time.time', return_value=1000000000):
+            first = self.render(source)
+        with mock.patch('time.time', return_value=1000000100):
+            second = self.render(source)
+        self.assertEqual(first, second)
+
+    def test_include_cache_timeout(self):
+        included = self.render('{% bootstrap_paginate page_obj include_mode="esi" %}')
+        url = include_url(esi_re, esi_re.match(included).group(1)).replace('$(QUERY_STRING)', self.query_string)
+
+        response = self.client.get(url)
+        self.assertFalse(response.has_header('Cache-Control'))
+
+        with override_settings(BOOTSTRAP_PAGINATION_INCLUDE_CACHE_TIMEOUT=600):
+            response = self.client.get(url)
+        self.assertIn('max-age=600', response['Cache-Control'])
+        self.assertIn('public', response['Cache-Control'])
+
+    def test_pager_ssi(self):
+        included = self.render('{% bootstrap_pager page_obj include_mode="ssi" %}')
+        self.assertTrue(ssi_re.match(included))
+        self.assertTrue(included.endswith('&${QUERY_STRING}" -->'))
+        self.assertNotIn('&amp;', included)
+
+        expected = self.render('{% bootstrap_pager page_obj %}')
+        self.assertEqual(process_includes(self.client, ssi_re, included, self.query_string), expected)
+
+    def test_page_query_string_with_same_names(self):
+        # The page's own filters may use the names of our parameter
+        self.query_string = "state=CA&%s=x&page=4" % INCLUDE_PARAM_NAME
+        self.request.GET = django.http.QueryDict(self.query_string)
+        included = self.render('{% bootstrap_paginate page_obj include_mode="esi" %}')
+
+        expected = self.render('{% bootstrap_paginate page_obj %}')
+        self.assertEqual(process_includes(self.client, esi_re, included, self.query_string), expected)
+        self.assertIn("state=CA", expected)
+        self.assertIn("%s=x" % INCLUDE_PARAM_NAME, expected)
+
+    def test_invalid_include_mode(self):
+        with self.assertRaises(Exception):
+            self.render('{% bootstrap_paginate page_obj include_mode="html" %}')
+
+    def test_tampered_state(self):
+        included = self.render('{% bootstrap_paginate page_obj include_mode="esi" %}')
+        url = include_url(esi_re, esi_re.match(included).group(1))
+        response = self.client.get(url.replace(INCLUDE_PARAM_NAME + "=", INCLUDE_PARAM_NAME + "=x"))
+        self.assertEqual(response.status_code, 400)
@@ -6,17 +6,24 @@ SETTINGS_MODULE = "tests.test_settings"
 
 INSTALLED_APPS = (
     'bootstrap_pagination',
+    'tests',
 )
 
-DATABASES = {}
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
 MIDDLEWARE_CLASSES = ()
 
-ROOT_URLCONF = 'tests.test_settings.urls'
+ROOT_URLCONF = 'tests.urls'
 SECRET_KEY = 'secretkey'
 SITE_ROOT = '.'
 
 
 TEMPLATE_DEBUG = True
+# tests/templates is found through APP_DIRS
 TEMPLATE_DIRS = ()
 
 TEMPLATES = [
@@ -26,10 +33,9 @@ TEMPLATES = [
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
+                'django.template.context_processors.request',
             ],
             'debug': TEMPLATE_DEBUG,
         },
     },
 ]
-
-urls = []
@@ -0,0 +1,137 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import sys
+from multiprocessing.pool import ThreadPool
+
+import lxml.html
+
+try:
+    from django.template.loader import get_template_from_string
+except ImportError:
+    from django.template import Engine
+    get_template_from_string = Engine.get_default().from_string
+
+try:
+    from django.core.urlresolvers import reverse
+except ImportError:  # Django 2+
+    from django.urls import reverse
+from django.template import Context
+import django.http
+from django.core.paginator import Paginator
+
+
+THREADS = 16
+RENDERS = 1000
+
+
+class ThreadSafetyTestCase(unittest.TestCase):
+    """
+    Renders the same compiled template nodes from many threads at once and
+    checks that every link points at the page it is labelled with.
+    """
+    def setUp(self):
+        # Switch threads as often as possible so that renders actually interleave
+        if hasattr(sys, 'setswitchinterval'):
+            self.switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+        else:  # Python 2
+            self.switch_interval = sys.getcheckinterval()
+            sys.setcheckinterval(1)
+
+        objects = ["obj%02x" % idx for idx in range(200)]
+        self.paginator = Paginator(objects, 10)
+        self.pool = ThreadPool(THREADS)
+
+    def tearDown(self):
+        self.pool.close()
+        self.pool.join()
+
+        if hasattr(sys, 'setswitchinterval'):
+            sys.setswitchinterval(self.switch_interval)
+        else:  # Python 2
+            sys.setcheckinterval(self.switch_interval)
+
+    def render_all(self, render):
+        failures = [failure
+                    for failure in self.pool.map(render, range(RENDERS))
+                    if failure is not None]
+        self.assertEqual(failures, [])
+
+    def page_hrefs(self, html):
+        fragment = lxml.html.fragment_fromstring(html)
+        return set(link.get('href') for link in fragment.cssselect('a'))
+
+    def test_paginate_shared_extra_kwargs(self):
+        template = get_template_from_string("""
+            {% load bootstrap_pagination %}
+            {% bootstrap_paginate page_obj url_view_name="listing" url_extra_kwargs=extra show_first_last="true" %}
+        """)
+        # One dict shared by every render, as a module level default would be
+        extra = {'category': 'books'}
+        urls = dict((num, reverse('listing', kwargs={'category': 'books', 'page': num}))
+                    for num in self.paginator.page_range)
+
+        def render(idx):
+            current = idx % self.paginator.num_pages + 1
+            html = template.render(Context({
+                'page_obj': self.paginator.page(current),
+                'extra': extra,
+                'request': django.http.HttpRequest()}))
+            expected = set(url for num, url in urls.items() if num != current)
+            hrefs = self.page_hrefs(html)
+            if hrefs != expected:
+                return current, sorted(hrefs ^ expected)
+
+        self.render_all(render)
+        self.assertEqual(extra, {'category': 'books'})
+
+    def test_paginate_get_params(self):
+        template = get_template_from_string("""
+            {% load bootstrap_pagination %}
+            {% bootstrap_paginate page_obj range=5 %}
+        """)
+
+        def render(idx):
+            current = idx % self.paginator.num_pages + 1
+            request = django.http.HttpRequest()
+            request.GET = django.http.QueryDict("filter=%d&page=%d" % (idx, current))
+            html = template.render(Context({
+                'page_obj': self.paginator.page(current),
+                'request': request}))
+            for href in self.page_hrefs(html):
+                params = django.http.QueryDict(href.lstrip('?'))
+                if params['filter'] != str(idx) or params['page'] == str(current):
+                    return idx, href
+            if request.GET['page'] != str(current):
+                return idx, request.GET.urlencode()
+
+        self.render_all(render)
+
+    def test_pager_shared_extra_kwargs(self):
+        template = get_template_from_string("""
+            {% load bootstrap_pagination %}
+            {% bootstrap_pager page_obj url_view_name="listing" url_extra_kwargs=extra %}
+        """)
+        extra = {'category': 'music'}
+
+        def render(idx):
+            current = idx % self.paginator.num_pages + 1
+            page = self.paginator.page(current)
+            html = template.render(Context({
+                'page_obj': page,
+                'extra': extra,
+                'request': django.http.HttpRequest()}))
+            expected = set()
+            if page.has_previous():
+                expected.add(reverse('listing', kwargs={'category': 'music', 'page': current - 1}))
+            if page.has_next():
+                expected.add(reverse('listing', kwargs={'category': 'music', 'page': current + 1}))
+            hrefs = self.page_hrefs(html)
+            if hrefs != expected:
+                return current, sorted(hrefs ^ expected)
+
+        self.render_all(render)
+        self.assertEqual(extra, {'category': 'music'})
@@ -0,0 +1,125 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import datetime
+
+import mock
+
+import django
+from django.db import connection
+from django.test import Client
+from django.utils import translation
+
+from tests.models import Post
+if django.VERSION >= (1, 11, 0):
+    from tests.urls import ConditionalListView
+
+
+@unittest.skipIf(django.VERSION < (1, 11, 0), "Requires Django 1.11+")
+class ConditionalPaginationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = Client()
+
+    def test_200_sets_validators(self):
+        response = self.client.get('/conditional/?page=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'class="pagination', response.content)
+        # The ETag doesn't cover the rendered objects, so it is weak
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertFalse(response.has_header('Last-Modified'))
+
+    def test_304_on_matching_etag(self):
+        etag = self.client.get('/conditional/?page=2')['ETag']
+        with mock.patch.object(ConditionalListView, 'get_context_data') as get_context_data:
+            response = self.client.get('/conditional/?page=2', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(get_context_data.called)
+
+    def test_200_on_other_page(self):
+        etag = self.client.get('/conditional/?page=2')['ETag']
+        response = self.client.get('/conditional/?page=3', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_200_on_other_url_params(self):
+        etag = self.client.get('/conditional/?page=2&filter=a')['ETag']
+        response = self.client.get('/conditional/?page=2&filter=b', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'filter=b', response.content)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_200_on_other_options(self):
+        etag = self.client.get('/conditional/?page=2')['ETag']
+        with mock.patch.object(ConditionalListView, 'pagination_options', {'range': 5}):
+            response = self.client.get('/conditional/?page=2', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_200_on_other_language(self):
+        etag = self.client.get('/conditional/?page=2')['ETag']
+        with translation.override('ru'):
+            response = self.client.get('/conditional/?page=2', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_pagination_options_hook(self):
+        etag = self.client.get('/conditional/?page=2')['ETag']
+        with mock.patch.object(ConditionalListView, 'get_pagination_options', return_value={}):
+            response = self.client.get('/conditional/?page=2', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_no_last_modified_without_queryset(self):
+        # The aggregate can only be run on a QuerySet
+        with mock.patch.object(ConditionalListView, 'last_modified_field', 'updated_at'):
+            response = self.client.get('/conditional/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Last-Modified'))
+
+    def test_invalid_page(self):
+        response = self.client.get('/conditional/?page=9')
+        self.assertEqual(response.status_code, 404)
+
+
+@unittest.skipIf(django.VERSION < (1, 11, 0), "Requires Django 1.11+")
+class LastModifiedTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            editor.create_model(Post)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as editor:
+            editor.delete_model(Post)
+
+    def setUp(self):
+        self.client = Client()
+        # Ordered by pk, so the most recent update is on the second page
+        for day in (3, 1, 5, 2):
+            Post.objects.create(updated_at=datetime.datetime(2019, 1, day, 12, 0, 0))
+
+    def tearDown(self):
+        Post.objects.all().delete()
+
+    def test_last_modified(self):
+        response = self.client.get('/posts/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Last-Modified'], 'Sat, 05 Jan 2019 12:00:00 GMT')
+
+        response = self.client.get('/posts/',
+                                   HTTP_IF_MODIFIED_SINCE='Sat, 05 Jan 2019 12:00:00 GMT')
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get('/posts/',
+                                   HTTP_IF_MODIFIED_SINCE='Fri, 04 Jan 2019 12:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+
+    def test_update_invalidates(self):
+        etag = self.client.get('/posts/')['ETag']
+        Post.objects.filter(updated_at__day=2).update(updated_at=datetime.datetime(2019, 1, 9, 12, 0, 0))
+        response = self.client.get('/posts/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Last-Modified'], 'Wed, 09 Jan 2019 12:00:00 GMT')
@@ -0,0 +1,95 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import mock
+
+try:
+    from StringIO import StringIO
+except ImportError:  # Python 3
+    from io import StringIO
+
+import django
+
+# Warming up requires multiple template engine support
+if django.VERSION >= (1, 8, 0):
+    from django.apps import apps
+    from django.core.management import call_command
+    from django.template import engines
+    from django.test.utils import override_settings
+
+    from bootstrap_pagination import warmup
+else:
+    def override_settings(**kwargs):
+        return lambda test: test
+
+
+@unittest.skipIf(django.VERSION < (1, 8, 0), "Requires Django 1.8+")
+class WarmUpTestCase(unittest.TestCase):
+    def test_find_project_templates(self):
+        engine = engines['django']
+        templates = list(warmup.find_project_templates(engine))
+        self.assertIn('listing.html', templates)
+        # The package's own pagination.html loads the library too
+        self.assertIn('bootstrap_pagination/pagination.html', templates)
+        self.assertNotIn('bootstrap_pagination/pager.html', templates)
+
+    def test_warm_up(self):
+        timings = warmup.warm_up()
+        self.assertEqual([name for name, count, seconds in timings],
+                         [name for name, step in warmup.WARM_UP_STEPS])
+        counts = dict((name, count) for name, count, seconds in timings)
+        self.assertEqual(counts['template library'], 1)
+        self.assertEqual(counts['package templates'], 2)
+        self.assertEqual(counts['project templates'], 1)
+        self.assertEqual(counts['translations'], 1)
+        for name, count, seconds in timings:
+            self.assertTrue(seconds >= 0)
+
+    def test_command(self):
+        out = StringIO()
+        call_command('warm_bootstrap_pagination', stdout=out)
+        output = out.getvalue()
+        for name, step in warmup.WARM_UP_STEPS:
+            self.assertIn(name + ':', output)
+        self.assertIn('Total:', output)
+
+    def test_warm_up_languages(self):
+        self.assertEqual(warmup.get_warm_up_languages(), ['en-us'])
+        with override_settings(LANGUAGE_CODE='ru', LANGUAGES=[('en', 'English'), ('ru', 'Russian')]):
+            self.assertEqual(warmup.get_warm_up_languages(), ['ru', 'en'])
+        with override_settings(USE_I18N=False):
+            self.assertEqual(warmup.get_warm_up_languages(), [])
+
+    def test_ready_disabled(self):
+        config = apps.get_app_config('bootstrap_pagination')
+        with mock.patch('bootstrap_pagination.warmup.warm_up') as warm_up:
+            config.ready()
+        self.assertFalse(warm_up.called)
+
+    @override_settings(BOOTSTRAP_PAGINATION_WARM_UP=True)
+    def test_ready_logs_timings(self):
+        config = apps.get_app_config('bootstrap_pagination')
+        with self.assertLogs('bootstrap_pagination.apps', 'INFO') as logs:
+            config.ready()
+        self.assertEqual(len(logs.output), len(warmup.WARM_UP_STEPS))
+        for (name, step), line in zip(warmup.WARM_UP_STEPS, logs.output):
+            self.assertIn('Warmed up %s:' % name, line)
+
+    def test_broken_project_template(self):
+        with mock.patch.object(warmup, 'find_project_templates',
+                               return_value=['listing.html', 'missing.html']):
+            with self.assertLogs('bootstrap_pagination.warmup', 'WARNING') as logs:
+                count = warmup.compile_project_templates()
+        self.assertEqual(count, 1)
+        self.assertIn('missing.html', logs.output[0])
+
+    @override_settings(BOOTSTRAP_PAGINATION_WARM_UP=True)
+    def test_ready_survives_broken_template(self):
+        config = apps.get_app_config('bootstrap_pagination')
+        with mock.patch.object(warmup, 'find_project_templates',
+                               return_value=['missing.html']):
+            with self.assertLogs('bootstrap_pagination', 'INFO') as logs:
+                config.ready()
+        self.assertIn('missing.html', logs.output[0])
@@ -0,0 +1,47 @@
+import django
+try:
+    from django.urls import include, re_path
+except ImportError:  # Django < 2
+    from django.conf.urls import include, url as re_path
+from django.http import HttpResponse
+
+
+def listing(request, category, page):
+    return HttpResponse()
+
+
+urlpatterns = [
+    re_path(r'^listing/(?P<category>[\w-]+)/(?P<page>\d+)/$', listing, name='listing'),
+]
+
+
+# The include view's URLconf sets app_name, which requires Django 1.9+
+if django.VERSION >= (1, 9, 0):
+    urlpatterns += [
+        re_path(r'^pagination/', include('bootstrap_pagination.urls')),
+    ]
+
+
+# ConditionalPaginationMixin requires Django 1.11+
+if django.VERSION >= (1, 11, 0):
+    from django.views.generic import ListView
+
+    from bootstrap_pagination.views import ConditionalPaginationMixin
+    from tests.models import Post
+
+    class ConditionalListView(ConditionalPaginationMixin, ListView):
+        queryset = ["obj%02x" % idx for idx in range(30)]
+        paginate_by = 10
+        template_name = 'listing.html'
+        pagination_options = {'range': 10}
+
+    class PostListView(ConditionalPaginationMixin, ListView):
+        queryset = Post.objects.order_by('pk')
+        paginate_by = 2
+        template_name = 'listing.html'
+        last_modified_field = 'updated_at'
+
+    urlpatterns += [
+        re_path(r'^conditional/$', ConditionalListView.as_view(), name='conditional'),
+        re_path(r'^posts/$', PostListView.as_view(), name='posts'),
+    ]